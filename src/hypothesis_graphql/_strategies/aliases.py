@@ -1,45 +1,51 @@
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 import graphql
 
+from ..nodes import Name
 from ..types import SelectionNodes
 
 
-def maybe_add_alias_to_node(node: graphql.SelectionNode, seen: Dict[Tuple[str, str], List]) -> None:
-    if isinstance(node, graphql.FieldNode):
-        maybe_add_alias(node, node.arguments, seen)
-        if node.selection_set.selections:
-            for selection in node.selection_set.selections:
-                maybe_add_alias_to_node(selection, seen)
-    if isinstance(node, graphql.InlineFragmentNode):
-        for selection in node.selection_set.selections:
-            maybe_add_alias(selection, selection.arguments, seen)
-            if selection.selection_set.selections:
-                for sub_selection in selection.selection_set.selections:
-                    maybe_add_alias_to_node(sub_selection, seen)
+def maybe_add_alias_to_nodes(nodes: SelectionNodes, seen: Dict[Tuple[str, str], int]) -> None:
+    """Walk the selection tree in depth-first order and add aliases to conflicting fields."""
+    FieldNode = graphql.FieldNode
+    # Children are pushed in reverse, so nodes are visited in the same order as they appear in the query
+    stack = list(reversed(nodes))
+    while stack:
+        node = stack.pop()
+        if type(node) is FieldNode:
+            maybe_add_alias(node, node.arguments, seen)  # type: ignore
+        # Only field & inline fragment nodes are generated, and both of them have selection sets
+        selections = node.selection_set.selections  # type: ignore[attr-defined]
+        if selections:
+            stack.extend(reversed(selections))
 
 
 def maybe_add_alias(
     field_node: graphql.FieldNode,
     arguments: List[graphql.ArgumentNode],
-    seen: Dict[Tuple[str, str], List],
+    seen: Dict[Tuple[str, str], int],
 ) -> None:
+    field_name = field_node.name.value
     for argument in arguments:
-        key = (field_node.name.value, argument.name.value)
-        value = argument.value
-        if key in seen:
+        key = (field_name, argument.name.value)
+        # Only the number of previous occurrences matters, the argument values themselves are not needed
+        count = seen.get(key, 0)
+        if count:
             # Simply add an alias, the values could be the same, so it not technically necessary, but this is safe
             # and simpler, but a bit reduces the possible input variety
-            field_node.alias = graphql.NameNode(value=f"{field_node.name.value}_{len(seen[key])}")
-            seen[key].append(value)
-        else:
-            seen[key] = [value]
+            field_node.alias = make_alias(field_name, count)
+        seen[key] = count + 1
 
 
-def add_selection_aliases(nodes: Optional[SelectionNodes]) -> Optional[SelectionNodes]:
+@lru_cache(maxsize=None)
+def make_alias(field_name: str, count: int) -> graphql.NameNode:
+    # Field names are limited by the schema, and counts by the number of sibling fields
+    return Name(f"{field_name}_{count}")
+
+
+def add_selection_aliases(nodes: SelectionNodes) -> None:
     """Add aliases to fields that have conflicting argument types."""
-    if nodes and len(nodes) > 1:
-        seen: Dict[Tuple[str, str], List] = {}
-        for node in nodes:
-            maybe_add_alias_to_node(node, seen)
-    return nodes
+    seen: Dict[Tuple[str, str], int] = {}
+    maybe_add_alias_to_nodes(nodes, seen)
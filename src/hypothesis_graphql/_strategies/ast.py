@@ -1,17 +1,25 @@
+import typing
+
 import graphql
 
 from ..types import SelectionNodes
 
 
-def make_document_node(selections: SelectionNodes, *, kind: graphql.OperationType) -> graphql.DocumentNode:
+# Constructors are passed as locals to optimize the byte code a little
+def make_document_node(
+    selections: SelectionNodes,
+    *,
+    kind: graphql.OperationType,
+    DocumentNode: typing.Type[graphql.DocumentNode] = graphql.DocumentNode,
+    OperationDefinitionNode: typing.Type[graphql.OperationDefinitionNode] = graphql.OperationDefinitionNode,
+    SelectionSetNode: typing.Type[graphql.SelectionSetNode] = graphql.SelectionSetNode,
+) -> graphql.DocumentNode:
     """Create top-level node for an operation AST."""
-    return graphql.DocumentNode(
-        kind="document",
+    return DocumentNode(
         definitions=[
-            graphql.OperationDefinitionNode(
-                kind="operation_definition",
+            OperationDefinitionNode(
                 operation=kind,
-                selection_set=graphql.SelectionSetNode(kind="selection_set", selections=selections),
+                selection_set=SelectionSetNode(selections=selections),
             )
         ],
     )
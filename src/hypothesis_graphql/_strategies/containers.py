@@ -4,6 +4,5 @@ T = TypeVar("T")
 
 
 def flatten(items: Tuple[List[T], T]) -> List[T]:
-    output = items[0]
-    output.extend(items[1:])
-    return output
+    # Build a new list in one go, so the result does not alias the first item
+    return [*items[0], *items[1:]]
@@ -8,48 +8,59 @@ from typing import Callable, List, Optional, Tuple
 
 import graphql
 
+from .. import nodes
 from ..types import SelectionNodes
 from .aliases import add_selection_aliases
 
 FieldNodeInput = Tuple[List[graphql.ArgumentNode], Optional[SelectionNodes]]
 
 
-@lru_cache
+@lru_cache(maxsize=None)
 def inline_fragment(type_name: str) -> Callable[[SelectionNodes], graphql.InlineFragmentNode]:
-    def factory(nodes: SelectionNodes) -> graphql.InlineFragmentNode:
+    type_condition = graphql.NamedTypeNode(name=nodes.Name(type_name))
+
+    def factory(selections: SelectionNodes) -> graphql.InlineFragmentNode:
         return graphql.InlineFragmentNode(
-            type_condition=graphql.NamedTypeNode(
-                name=graphql.NameNode(value=type_name),
-            ),
-            selection_set=graphql.SelectionSetNode(kind="selection_set", selections=nodes),
+            type_condition=type_condition,
+            selection_set=graphql.SelectionSetNode(selections=selections),
         )
 
     return factory
 
 
-@lru_cache
+@lru_cache(maxsize=None)
 def argument(name: str) -> Callable[[graphql.ValueNode], graphql.ArgumentNode]:
+    name_node = nodes.Name(name)
+
     def factory(value: graphql.ValueNode) -> graphql.ArgumentNode:
-        return graphql.ArgumentNode(name=graphql.NameNode(value=name), value=value)
+        return graphql.ArgumentNode(name=name_node, value=value)
 
     return factory
 
 
-@lru_cache
+@lru_cache(maxsize=None)
 def field(name: str) -> Callable[[FieldNodeInput], graphql.FieldNode]:
+    name_node = nodes.Name(name)
+
     def factory(tup: FieldNodeInput) -> graphql.FieldNode:
+        selections = tup[1]
+        # Most fields are leaves or have a single child, then there is nothing that could conflict
+        if selections is not None and len(selections) > 1:
+            add_selection_aliases(selections)
         return graphql.FieldNode(
-            name=graphql.NameNode(value=name),
+            name=name_node,
             arguments=tup[0],
-            selection_set=graphql.SelectionSetNode(kind="selection_set", selections=add_selection_aliases(tup[1])),
+            selection_set=graphql.SelectionSetNode(selections=selections),
         )
 
     return factory
 
 
-@lru_cache
+@lru_cache(maxsize=None)
 def object_field(name: str) -> Callable[[graphql.ValueNode], graphql.ObjectFieldNode]:
+    name_node = nodes.Name(name)
+
     def factory(value: graphql.ValueNode) -> graphql.ObjectFieldNode:
-        return graphql.ObjectFieldNode(name=graphql.NameNode(value=name), value=value)
+        return graphql.ObjectFieldNode(name=name_node, value=value)
 
     return factory
@@ -1,7 +1,7 @@
 """Strategies for simple types like scalars or enums."""
 
 from functools import lru_cache
-from typing import Optional, Tuple, Type, TypeVar, Union
+from typing import Callable, Dict, Optional, Tuple, Type, TypeVar, Union
 
 import graphql
 from hypothesis import strategies as st
@@ -26,6 +26,10 @@ INTEGER_STRATEGY = st.integers(min_value=MIN_INT, max_value=MAX_INT).map(nodes.I
 FLOAT_STRATEGY = st.floats(allow_infinity=False, allow_nan=False).map(nodes.Float)
 BOOLEAN_STRATEGY = st.booleans().map(nodes.Boolean)
 NULL_STRATEGY = st.just(nodes.Null)
+# Nullable variants are needed for every optional argument / input field, therefore they are built once
+NULLABLE_INTEGER_STRATEGY: st.SearchStrategy = INTEGER_STRATEGY | NULL_STRATEGY
+NULLABLE_FLOAT_STRATEGY: st.SearchStrategy = FLOAT_STRATEGY | NULL_STRATEGY
+NULLABLE_BOOLEAN_STRATEGY: st.SearchStrategy = BOOLEAN_STRATEGY | NULL_STRATEGY
 
 
 @lru_cache(maxsize=16)
@@ -35,41 +39,36 @@ def scalar(
     nullable: bool = True,
     default: Optional[graphql.ValueNode] = None,
 ) -> st.SearchStrategy[ScalarValueNode]:
-    if type_name == "Int":
-        return int_(nullable=nullable, default=default)
-    if type_name == "Float":
-        return float_(nullable=nullable, default=default)
-    if type_name == "String":
-        return string(nullable=nullable, default=default, alphabet=alphabet)
-    if type_name == "ID":
-        return id_(nullable=nullable, default=default, alphabet=alphabet)
-    if type_name == "Boolean":
-        return boolean(nullable=nullable, default=default)
-    raise InvalidArgument(
-        f"Scalar {type_name!r} is not supported. "
-        "Provide a Hypothesis strategy via the `custom_scalars` argument to generate it."
-    )
+    factory = SCALAR_FACTORIES.get(type_name)
+    if factory is None:
+        raise InvalidArgument(
+            f"Scalar {type_name!r} is not supported. "
+            "Provide a Hypothesis strategy via the `custom_scalars` argument to generate it."
+        )
+    return factory(alphabet, nullable, default)
 
 
 def int_(
     *, nullable: bool = True, default: Optional[graphql.ValueNode] = None
 ) -> st.SearchStrategy[graphql.IntValueNode]:
-    return maybe_default(maybe_null(INTEGER_STRATEGY, nullable), default=default)
+    return maybe_default(NULLABLE_INTEGER_STRATEGY if nullable else INTEGER_STRATEGY, default=default)
 
 
 def float_(
     *, nullable: bool = True, default: Optional[graphql.ValueNode] = None
 ) -> st.SearchStrategy[graphql.FloatValueNode]:
-    return maybe_default(maybe_null(FLOAT_STRATEGY, nullable), default=default)
+    return maybe_default(NULLABLE_FLOAT_STRATEGY if nullable else FLOAT_STRATEGY, default=default)
+
+
+@lru_cache(maxsize=16)
+def _strings(alphabet: st.SearchStrategy[str]) -> st.SearchStrategy[graphql.StringValueNode]:
+    return st.text(alphabet=alphabet).map(_string)
 
 
 def string(
     *, nullable: bool = True, default: Optional[graphql.ValueNode] = None, alphabet: st.SearchStrategy[str]
 ) -> st.SearchStrategy[graphql.StringValueNode]:
-    return maybe_default(
-        maybe_null(st.text(alphabet=alphabet).map(_string), nullable),
-        default=default,
-    )
+    return maybe_default(maybe_null(_strings(alphabet), nullable), default=default)
 
 
 def id_(
@@ -81,7 +80,17 @@ def id_(
 def boolean(
     *, nullable: bool = True, default: Optional[graphql.ValueNode] = None
 ) -> st.SearchStrategy[graphql.BooleanValueNode]:
-    return maybe_default(maybe_null(BOOLEAN_STRATEGY, nullable), default=default)
+    return maybe_default(NULLABLE_BOOLEAN_STRATEGY if nullable else BOOLEAN_STRATEGY, default=default)
+
+
+# Built-in scalar name -> strategy factory accepting `alphabet`, `nullable` and `default`
+SCALAR_FACTORIES: Dict[str, Callable[..., st.SearchStrategy[ScalarValueNode]]] = {
+    "Int": lambda alphabet, nullable, default: int_(nullable=nullable, default=default),
+    "Float": lambda alphabet, nullable, default: float_(nullable=nullable, default=default),
+    "String": lambda alphabet, nullable, default: string(nullable=nullable, default=default, alphabet=alphabet),
+    "ID": lambda alphabet, nullable, default: id_(nullable=nullable, default=default, alphabet=alphabet),
+    "Boolean": lambda alphabet, nullable, default: boolean(nullable=nullable, default=default),
+}
 
 
 def maybe_null(strategy: st.SearchStrategy[T], nullable: bool) -> st.SearchStrategy[T]:
@@ -0,0 +1,135 @@
+"""A printer for the AST nodes generated by this library.
+
+It produces the same output as `graphql.print_ast` (graphql-core 3.2) for operations built by strategies, but avoids
+the generic visitor machinery, which is the dominant cost of converting a generated AST to a string.
+"""
+
+from typing import Any, Callable, Dict, Optional, Type
+
+import graphql
+
+from ..types import AstPrinter, SelectionNodes
+from .ast import make_mutation, make_query
+
+MAX_LINE_LENGTH = 80
+
+# graphql-core 3.1 formats some nodes differently and has no `print_string`, therefore the specialized printer is not
+# used there
+print_string: Optional[Callable[[str], str]] = getattr(graphql.language.printer, "print_string", None)
+
+
+def print_query(selections: SelectionNodes) -> str:
+    """Print selections as a query without building the document AST."""
+    return _print_selections(selections)
+
+
+def print_mutation(selections: SelectionNodes) -> str:
+    """Print selections as a mutation without building the document AST."""
+    return "mutation " + _print_selections(selections)
+
+
+def _print_selection_set(node: graphql.SelectionSetNode) -> str:
+    # TYPING: Only field & inline fragment nodes are generated
+    return _print_selections(node.selections)  # type: ignore[arg-type]
+
+
+def _print_selections(selections: SelectionNodes) -> str:
+    if not selections:
+        return ""
+    inner = "\n".join([_print_selection(selection) for selection in selections])
+    return "{\n  " + inner.replace("\n", "\n  ") + "\n}"
+
+
+def _print_selection(node: graphql.SelectionNode) -> str:
+    if type(node) is graphql.InlineFragmentNode:
+        return _join_block(f"... on {node.type_condition.name.value}", node.selection_set)
+    # TYPING: Only `FieldNode` and `InlineFragmentNode` are generated
+    name = node.name.value  # type: ignore[attr-defined]
+    alias = node.alias  # type: ignore[attr-defined]
+    if alias is not None:
+        name = f"{alias.value}: {name}"
+    arguments = node.arguments  # type: ignore[attr-defined]
+    if arguments:
+        printed = [f"{argument.name.value}: {print_value(argument.value)}" for argument in arguments]
+        line = f"{name}({', '.join(printed)})"
+        if len(line) > MAX_LINE_LENGTH:
+            line = name + "(\n  " + "\n".join(printed).replace("\n", "\n  ") + "\n)"
+        name = line
+    return _join_block(name, node.selection_set)  # type: ignore[attr-defined]
+
+
+def _join_block(prefix: str, selection_set: graphql.SelectionSetNode) -> str:
+    block = _print_selection_set(selection_set)
+    if block:
+        return f"{prefix} {block}"
+    return prefix
+
+
+def _print_string(node: graphql.StringValueNode) -> str:
+    if node.block:
+        return graphql.print_ast(node)
+    # TYPING: The specialized printer is used only if `print_string` is available
+    return print_string(node.value)  # type: ignore[misc]
+
+
+def _print_boolean(node: graphql.BooleanValueNode) -> str:
+    return "true" if node.value else "false"
+
+
+def _print_null(node: graphql.NullValueNode) -> str:
+    return "null"
+
+
+def _print_plain(node: graphql.ValueNode) -> str:
+    # TYPING: Int, Float & Enum nodes are printed as their values
+    return node.value  # type: ignore[attr-defined]
+
+
+def _print_list(node: graphql.ListValueNode) -> str:
+    return f"[{', '.join([print_value(value) for value in node.values])}]"
+
+
+def _print_object(node: graphql.ObjectValueNode) -> str:
+    return f"{{{', '.join([f'{field.name.value}: {print_value(field.value)}' for field in node.fields])}}}"
+
+
+VALUE_PRINTERS: Dict[Type[graphql.ValueNode], Callable[[Any], str]] = {
+    graphql.IntValueNode: _print_plain,
+    graphql.FloatValueNode: _print_plain,
+    graphql.EnumValueNode: _print_plain,
+    graphql.StringValueNode: _print_string,
+    graphql.BooleanValueNode: _print_boolean,
+    graphql.NullValueNode: _print_null,
+    graphql.ListValueNode: _print_list,
+    graphql.ObjectValueNode: _print_object,
+}
+
+
+def print_value(node: graphql.ValueNode) -> str:
+    printer = VALUE_PRINTERS.get(type(node))
+    if printer is None:
+        # Custom scalar strategies may generate any nodes
+        return graphql.print_ast(node)
+    return printer(node)
+
+
+OPERATION_PRINTERS: Dict[Callable[[SelectionNodes], graphql.DocumentNode], Callable[[SelectionNodes], str]] = {
+    make_query: print_query,
+    make_mutation: print_mutation,
+}
+
+
+def resolve(
+    node_factory: Callable[[SelectionNodes], graphql.DocumentNode], print_ast: AstPrinter
+) -> Callable[[SelectionNodes], str]:
+    """Build a function converting generated selections to an operation string.
+
+    The specialized printer is used if the default one is requested and it is possible to replicate its output.
+    """
+    if print_ast is graphql.print_ast and print_string is not None:
+        return OPERATION_PRINTERS[node_factory]
+
+    def print_operation(selections: SelectionNodes) -> str:
+        return print_ast(node_factory(selections))
+
+    return print_operation
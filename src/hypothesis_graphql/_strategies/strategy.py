@@ -1,9 +1,9 @@
 # pylint: disable=unused-import
 import dataclasses
 import operator
-from functools import reduce, wraps
+from functools import lru_cache, reduce, wraps
 from operator import or_
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar, Union
 
 import graphql
 from graphql import is_equal_type
@@ -20,11 +20,13 @@ from ..types import (
     InterfaceOrObject,
     SelectionNodes,
 )
-from . import factories, primitives, validation
+from . import factories, primitives, printer, validation
 from .ast import make_mutation, make_query
 from .containers import flatten
 
+T = TypeVar("T")
 BY_NAME = operator.attrgetter("name")
+BY_FIRST = operator.itemgetter(0)
 EMPTY_LISTS_STRATEGY = st.builds(list)
 BUILT_IN_SCALAR_TYPE_NAMES = {"Int", "Float", "String", "ID", "Boolean"}
 
@@ -59,6 +61,8 @@ class GraphQLStrategy:
     # This is a per-method cache without limits as they are proportionate to the schema size
     _cache: Dict[str, Dict] = dataclasses.field(default_factory=dict)
 
+    # Input types are shared between arguments & input fields, therefore strategies are cached by the type instance itself
+    @instance_cache(lambda type_, default=None: (type_, default))
     def values(
         self,
         type_: graphql.GraphQLInputType,
@@ -123,7 +127,7 @@ class GraphQLStrategy:
             # If a required field is not possible to generate, then it will fail deeper anyway
             if self.can_generate_field(field) or graphql.is_required_input_field(field)
         }
-        strategy = subset_of_fields(fields, force_required=True).flatmap(self.lists_of_object_fields)
+        strategy = draw_each_field(subset_of_fields(fields, force_required=True), self.object_field_nodes)
         return primitives.maybe_null(strategy.map(nodes.Object), nullable)
 
     def can_generate_field(self, field: graphql.GraphQLInputField) -> bool:
@@ -138,18 +142,14 @@ class GraphQLStrategy:
             or type_.name in self.custom_scalars
         )
 
-    def lists_of_object_fields(
-        self, items: List[Tuple[str, graphql.GraphQLInputField]]
-    ) -> st.SearchStrategy[List[graphql.ObjectFieldNode]]:
-        return st.tuples(
-            *(
-                self.values(
-                    field.type,
-                    field.ast_node.default_value if field.ast_node is not None else None,
-                ).map(factories.object_field(name))
-                for name, field in items
-            )
-        ).map(list)
+    # Input fields are owned by the schema, therefore their identity is stable
+    @instance_cache(lambda name, field: (name, id(field)))
+    def object_field_nodes(
+        self, name: str, field: graphql.GraphQLInputField
+    ) -> st.SearchStrategy[graphql.ObjectFieldNode]:
+        """Generate a `graphql.ObjectFieldNode` for the given input field."""
+        default = field.ast_node.default_value if field.ast_node is not None else None
+        return self.values(field.type, default).map(factories.object_field(name))
 
     @instance_cache(
         lambda interface, implementations: (
@@ -199,17 +199,13 @@ class GraphQLStrategy:
         else:
             subset = object_type.fields
         # minimum 1 field, an empty query is not valid
-        return subset_of_fields(subset).flatmap(self.lists_of_fields)
-
-    def lists_of_fields(self, items: List[Tuple[str, Field]]) -> st.SearchStrategy[List[graphql.FieldNode]]:
-        return st.tuples(
-            *(
-                st.tuples(self.list_of_arguments(field.args), self.selections_for_type(field)).map(
-                    factories.field(name)
-                )
-                for name, field in items
-            )
-        ).map(list)
+        return draw_each_field(subset_of_fields(subset), self.field_nodes)
+
+    # Fields are owned by the schema, therefore their identity is stable
+    @instance_cache(lambda name, field: (name, id(field)))
+    def field_nodes(self, name: str, field: Field) -> st.SearchStrategy[graphql.FieldNode]:
+        """Generate a `graphql.FieldNode` for the given field."""
+        return st.tuples(self.list_of_arguments(field.args), self.selections_for_type(field)).map(factories.field(name))
 
     @instance_cache(lambda items: tuple(item.name for item in items))
     def collect_fragment_strategies(
@@ -230,32 +226,34 @@ class GraphQLStrategy:
             strategies.append(self.inline_fragment(item))
         return strategies, has_overlapping_fields
 
+    # The argument dicts are owned by the schema, therefore their identity is stable
+    @instance_cache(id)
     def list_of_arguments(
         self, arguments: Dict[str, graphql.GraphQLArgument]
     ) -> st.SearchStrategy[List[graphql.ArgumentNode]]:
         """Generate a list `graphql.ArgumentNode` for a field."""
         if not arguments:
             return st.just([])
-
-        @st.composite  # type: ignore
-        def inner(draw: Any) -> List[graphql.ArgumentNode]:
-            args = []
-            for name, argument in arguments.items():
-                default = argument.ast_node.default_value if argument.ast_node is not None else None
-                try:
-                    argument_strategy = self.values(argument.type, default=default)
-                except InvalidArgument:
-                    if not isinstance(argument.type, graphql.GraphQLNonNull):
-                        # If the type is nullable, then either generate `null` or skip it completely
-                        if draw(st.booleans()):
-                            args.append(graphql.ArgumentNode(name=graphql.NameNode(value=name), value=nodes.Null))
-                        continue
+        strategies = []
+        has_skippable = False
+        for name, argument in arguments.items():
+            default = argument.ast_node.default_value if argument.ast_node is not None else None
+            try:
+                argument_strategy = self.values(argument.type, default=default)
+            except InvalidArgument:
+                if isinstance(argument.type, graphql.GraphQLNonNull):
                     raise
-                args.append(draw(argument_strategy.map(factories.argument(name))))
-            return args
-
-        return inner()
-
+                # If the type is nullable, then either generate `null` or skip it completely
+                strategies.append(st.none() | st.just(factories.argument(name)(nodes.Null)))
+                has_skippable = True
+                continue
+            strategies.append(argument_strategy.map(factories.argument(name)))
+        if has_skippable:
+            return st.tuples(*strategies).map(_without_skipped)
+        return st.tuples(*strategies).map(list)
+
+    # The result depends only on the field type, therefore it is shared by all fields of the same type
+    @instance_cache(lambda field: field.type)
     def selections_for_type(
         self,
         field: graphql.GraphQLField,
@@ -271,18 +269,26 @@ class GraphQLStrategy:
             if not implementations:
                 # Shortcut when there are no implementations - take fields from the interface itself
                 return self.selections(field_type)
-            return st.lists(st.sampled_from(implementations), min_size=1, unique_by=BY_NAME).flatmap(
-                lambda impls: self.interfaces(field_type, impls)
-            )
+            return subsets_of_types(implementations).flatmap(lambda impls: self.interfaces(field_type, impls))
         if isinstance(field_type, graphql.GraphQLUnionType):
             # A union is a set of object types - take a subset of them and generate inline fragments
-            return st.lists(st.sampled_from(field_type.types), min_size=1, unique_by=BY_NAME).flatmap(
-                self.inline_fragments
-            )
+            return subsets_of_types(field_type.types).flatmap(self.inline_fragments)
         # Other types don't have fields
         return st.none()
 
 
+def subsets_of_types(types: Sequence[graphql.GraphQLObjectType]) -> st.SearchStrategy[List[graphql.GraphQLObjectType]]:
+    """Select a non-empty subset of unique object types."""
+    if len(types) == 1:
+        # The only possible subset
+        return st.just(list(types))
+    return st.lists(st.sampled_from(types), min_size=1, unique_by=BY_NAME)
+
+
+def _without_skipped(arguments: Tuple[Optional[graphql.ArgumentNode], ...]) -> List[graphql.ArgumentNode]:
+    return [argument for argument in arguments if argument is not None]
+
+
 def check_nullable(type_: graphql.GraphQLInputType) -> Tuple[graphql.GraphQLInputType, bool]:
     """Get the wrapped type and detect if it is nullable."""
     nullable = True
@@ -302,11 +308,33 @@ def unwrap_field_type(field: Field) -> graphql.GraphQLNamedType:
 
 def make_type_name(type_: graphql.GraphQLType) -> str:
     """Create a name for a type."""
-    name = ""
+    parts = []
     while isinstance(type_, graphql.GraphQLWrappingType):
-        name += type_.__class__.__name__.replace("GraphQL", "")
+        parts.append(type_.__class__.__name__.replace("GraphQL", ""))
         type_ = type_.of_type
-    return f"{name}{type_.name}"
+    # TYPING: Only named types are left after unwrapping
+    parts.append(type_.name)  # type: ignore[attr-defined]
+    return "".join(parts)
+
+
+@st.composite  # type: ignore
+def draw_each_field(
+    draw: Any,
+    subsets: st.SearchStrategy[Sequence[Tuple[str, Any]]],
+    to_strategy: Callable[[str, Any], st.SearchStrategy[T]],
+) -> List[T]:
+    """Draw a subset of fields and then a node for each of them.
+
+    Per-field strategies are cached, so unlike `flatmap` no new strategies are created on each draw.
+    """
+    return [draw(to_strategy(name, field)) for name, field in draw(subsets)]
+
+
+# Aliases for conflicting fields are needed on every draw, while types are immutable and hashed by identity
+@lru_cache(maxsize=256)
+def make_type_alias(field_name: str, type_: graphql.GraphQLType) -> graphql.NameNode:
+    """Create an alias for a field that conflicts with a field of another type."""
+    return nodes.Name(f"{field_name}_{make_type_name(type_)}")
 
 
 @st.composite  # type: ignore
@@ -319,31 +347,31 @@ def compose_interfaces_with_filter(
     selection_nodes = draw(already_selected)
     # Store what fields are already used and their corresponding types
     seen: Dict[str, graphql.GraphQLType] = {}
-
-    def mark_seen(frag: graphql.InlineFragmentNode) -> None:
-        # Add this fragment's fields to `seen`
-        fragment_type = type_map[frag.type_condition.name.value]
-        for selected in frag.selection_set.selections:
-            seen.setdefault(selected.name.value, fragment_type.fields[selected.name.value].type)
-
-    def add_alias(frag: graphql.InlineFragmentNode) -> graphql.InlineFragmentNode:
-        # Add an alias for all fields that have the same name with already selected ones but a different type
-        fragment_type = type_map[frag.type_condition.name.value]
-        for selected in frag.selection_set.selections:
-            field_name = selected.name.value
-            if field_name in seen:
-                field_type = fragment_type.fields[field_name].type
-                if not is_equal_type(seen[field_name], field_type):
-                    selected.alias = graphql.NameNode(value=f"{field_name}_{make_type_name(field_type)}")
-        return frag
-
     for strategy in strategies:
-        fragment = draw(strategy.map(add_alias))
+        fragment = draw(strategy)
+        add_aliases_and_mark_seen(fragment, seen, type_map)
         selection_nodes.append(fragment)
-        mark_seen(fragment)
     return selection_nodes
 
 
+def add_aliases_and_mark_seen(
+    fragment: graphql.InlineFragmentNode,
+    seen: Dict[str, graphql.GraphQLType],
+    type_map: Dict[str, graphql.GraphQLType],
+) -> None:
+    """Add an alias for all fields that have the same name with already selected ones but a different type."""
+    # TYPING: Fragments are generated only for object types
+    fields = type_map[fragment.type_condition.name.value].fields  # type: ignore[attr-defined]
+    for selected in fragment.selection_set.selections:
+        # TYPING: Fragments contain only field nodes
+        field_name = selected.name.value  # type: ignore[attr-defined]
+        field_type = fields[field_name].type
+        if field_name not in seen:
+            seen[field_name] = field_type
+        elif not is_equal_type(seen[field_name], field_type):
+            selected.alias = make_type_alias(field_name, field_type)  # type: ignore[attr-defined]
+
+
 def subset_of_fields(
     fields: Dict[str, graphql.GraphQLInputField], *, force_required: bool = False
 ) -> st.SearchStrategy[List[Tuple[str, graphql.GraphQLInputField]]]:
@@ -366,8 +394,11 @@ def subset_of_fields(
         if optional:
             return subset_of_fields(optional).map(required.__add__)
         return st.just(required)
+    if len(field_pairs) == 1:
+        # The only possible subset - no need to draw the list size & elements
+        return st.just(field_pairs)
     # pairs are unique by field name
-    return st.lists(st.sampled_from(field_pairs), min_size=1, unique_by=lambda x: x[0])
+    return st.lists(st.sampled_from(field_pairs), min_size=1, unique_by=BY_FIRST)
 
 
 def _make_strategy(
@@ -384,11 +415,33 @@ def _make_strategy(
         validation.validate_fields(fields, list(type_.fields))
     if custom_scalars:
         validation.validate_custom_scalars(custom_scalars)
-    return GraphQLStrategy(
-        schema=schema, alphabet=alphabet, custom_scalars=custom_scalars or {}, allow_null=allow_null
-    ).selections(type_, fields=fields)
+    return _cached_strategy(schema, _freeze_custom_scalars(custom_scalars), alphabet, allow_null).selections(
+        type_, fields=fields
+    )
+
 
+def _freeze_custom_scalars(
+    custom_scalars: Optional[CustomScalarStrategies],
+) -> Tuple[Tuple[str, st.SearchStrategy], ...]:
+    return tuple(custom_scalars.items()) if custom_scalars else ()
 
+
+# Each entry keeps its schema & generated strategies alive, therefore the cache is kept small
+@lru_cache(maxsize=16)
+def _cached_strategy(
+    schema: graphql.GraphQLSchema,
+    custom_scalars: Tuple[Tuple[str, st.SearchStrategy], ...],
+    alphabet: st.SearchStrategy[str],
+    allow_null: bool,
+) -> GraphQLStrategy:
+    # Repeated calls with the same arguments share the strategy & its internal caches, which are filled during
+    # generation. Unlike the `cacheable` decorator on public strategies, it also works when `fields` is a list or
+    # custom scalars are passed as a dictionary. It is also shared by `queries`, `mutations` and `from_schema`
+    return GraphQLStrategy(schema=schema, alphabet=alphabet, custom_scalars=dict(custom_scalars), allow_null=allow_null)
+
+
+# The same alphabet instance is needed to reuse cached strategies
+@lru_cache(maxsize=None)
 def _build_alphabet(allow_x00: bool = True, codec: Optional[str] = "utf-8") -> st.SearchStrategy[str]:
     return st.characters(
         codec=codec, min_codepoint=0 if allow_x00 else 1, max_codepoint=0xFFFF, blacklist_categories=["Cs"]
@@ -422,18 +475,14 @@ def queries(
     if parsed_schema.query_type is None:
         raise InvalidArgument("Query type is not defined in the schema")
     alphabet = _build_alphabet(allow_x00=allow_x00, codec=codec)
-    return (
-        _make_strategy(
-            parsed_schema,
-            type_=parsed_schema.query_type,
-            fields=fields,
-            custom_scalars=custom_scalars,
-            alphabet=alphabet,
-            allow_null=allow_null,
-        )
-        .map(make_query)
-        .map(print_ast)
-    )
+    return _make_strategy(
+        parsed_schema,
+        type_=parsed_schema.query_type,
+        fields=fields,
+        custom_scalars=custom_scalars,
+        alphabet=alphabet,
+        allow_null=allow_null,
+    ).map(printer.resolve(make_query, print_ast))
 
 
 @cacheable  # type: ignore
@@ -463,18 +512,14 @@ def mutations(
     if parsed_schema.mutation_type is None:
         raise InvalidArgument("Mutation type is not defined in the schema")
     alphabet = _build_alphabet(allow_x00=allow_x00, codec=codec)
-    return (
-        _make_strategy(
-            parsed_schema,
-            type_=parsed_schema.mutation_type,
-            fields=fields,
-            custom_scalars=custom_scalars,
-            alphabet=alphabet,
-            allow_null=allow_null,
-        )
-        .map(make_mutation)
-        .map(print_ast)
-    )
+    return _make_strategy(
+        parsed_schema,
+        type_=parsed_schema.mutation_type,
+        fields=fields,
+        custom_scalars=custom_scalars,
+        alphabet=alphabet,
+        allow_null=allow_null,
+    ).map(printer.resolve(make_mutation, print_ast))
 
 
 @cacheable  # type: ignore
@@ -518,11 +563,9 @@ def from_schema(
         validation.validate_fields(fields, available_fields)
 
     alphabet = _build_alphabet(allow_x00=allow_x00, codec=codec)
-    strategy = GraphQLStrategy(
-        parsed_schema, alphabet=alphabet, custom_scalars=custom_scalars or {}, allow_null=allow_null
-    )
+    strategy = _cached_strategy(parsed_schema, _freeze_custom_scalars(custom_scalars), alphabet, allow_null)
     strategies = [
-        strategy.selections(type_, fields=type_fields).map(node_factory).map(print_ast)
+        strategy.selections(type_, fields=type_fields).map(printer.resolve(node_factory, print_ast))
         for (type_, type_fields, node_factory) in (
             (query, query_fields, make_query),
             (mutation, mutation_fields, make_mutation),
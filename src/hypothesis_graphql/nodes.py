@@ -1,3 +1,4 @@
+import sys
 import typing
 from functools import lru_cache
 
@@ -21,7 +22,20 @@ def Float(
     return FloatValueNode(value=str(value))
 
 
-def Int(value: int, IntValueNode: typing.Type[graphql.IntValueNode] = graphql.IntValueNode) -> graphql.IntValueNode:
+# Hypothesis generates small integers often and shrinks towards them, therefore they are cached
+_SMALL_INTS = {value: graphql.IntValueNode(value=str(value)) for value in range(-256, 257)}
+
+
+def Int(
+    value: int,
+    IntValueNode: typing.Type[graphql.IntValueNode] = graphql.IntValueNode,
+    SMALL_INTS: typing.Dict[int, graphql.IntValueNode] = _SMALL_INTS,
+) -> graphql.IntValueNode:
+    # `bool` & `float` values are equal to some integers, but are converted to strings differently
+    if type(value) is int:
+        node = SMALL_INTS.get(value)
+        if node is not None:
+            return node
     return IntValueNode(value=str(value))
 
 
@@ -53,3 +67,12 @@ def Enum(value: str) -> graphql.EnumValueNode:
 
 
 Null = graphql.NullValueNode()
+
+
+# Names come from the schema, therefore their number is limited too. Shared instances are never mutated
+# Interned values make comparing them (e.g. as dictionary keys during aliasing) cheaper
+
+
+@lru_cache(maxsize=None)
+def Name(value: str) -> graphql.NameNode:
+    return graphql.NameNode(value=sys.intern(value))
@@ -3,7 +3,8 @@ from hypothesis import given
 from hypothesis import strategies as st
 from hypothesis.errors import InvalidArgument
 
-from hypothesis_graphql import from_schema
+from hypothesis_graphql import from_schema, mutations, nodes, queries
+from hypothesis_graphql._strategies.strategy import GraphQLStrategy
 
 QUERY = """type Query {
   getBooks: [Book]
@@ -44,3 +45,39 @@ def test_from_schema(data, schema, validate_operation, types, available_fields):
 def test_no_query_no_mutation(schema, validate_operation):
     with pytest.raises(InvalidArgument, match="Query or Mutation type must be provided"):
         from_schema(schema)
+
+
+@pytest.fixture
+def used_strategies(monkeypatch):
+    instances = []
+    selections = GraphQLStrategy.selections
+
+    def spy(self, *args, **kwargs):
+        instances.append(self)
+        return selections(self, *args, **kwargs)
+
+    monkeypatch.setattr(GraphQLStrategy, "selections", spy)
+    return instances
+
+
+def test_strategy_reuse(schema, used_strategies):
+    schema += f"\nscalar Date\n{QUERY}\n{MUTATION}"
+    # When strategies are created with non-hashable `fields` & `custom_scalars`
+    kwargs = {"fields": ["getBooks", "addBook"], "custom_scalars": {"Date": st.just(nodes.String("2024-01-01"))}}
+    queries(schema, fields=["getBooks"], custom_scalars=kwargs["custom_scalars"])
+    mutations(schema, fields=["addBook"], custom_scalars=dict(kwargs["custom_scalars"]))
+    from_schema(schema, **kwargs)
+    from_schema(schema, **kwargs)
+    # Then the same internal strategy is used for all of them
+    assert all(strategy is used_strategies[0] for strategy in used_strategies)
+
+
+@pytest.mark.parametrize("kwargs", ({"allow_null": False}, {"allow_x00": False}, {"codec": "ascii"}))
+def test_strategy_reuse_different_options(schema, used_strategies, kwargs):
+    schema += f"\n{QUERY}"
+    queries(schema, fields=["getBooks"])
+    # When options that affect generation are different
+    queries(schema, fields=["getBooks"], **kwargs)
+    # Then a separate internal strategy is used
+    first, second = used_strategies
+    assert first is not second
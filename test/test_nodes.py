@@ -0,0 +1,17 @@
+import pytest
+
+from hypothesis_graphql import nodes
+
+
+def test_small_int_shared():
+    # Small integers are served from a cache
+    assert nodes.Int(1) is nodes.Int(1)
+    assert nodes.Int(1).value == "1"
+
+
+@pytest.mark.parametrize("value, expected", ((True, "True"), (1.0, "1.0")))
+def test_int_not_shared_for_equal_values(value, expected):
+    # Values that are equal to cached integers, but printed differently, should not be served from the cache
+    node = nodes.Int(value)
+    assert node is not nodes.Int(1)
+    assert node.value == expected
@@ -0,0 +1,92 @@
+import graphql
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from hypothesis_graphql import nodes
+from hypothesis_graphql._strategies import printer
+from hypothesis_graphql._strategies.ast import make_mutation, make_query
+from hypothesis_graphql._strategies.strategy import GraphQLStrategy
+from hypothesis_graphql.cache import cached_build_schema
+
+pytestmark = pytest.mark.skipif(printer.print_string is None, reason="Not used with graphql-core < 3.2")
+
+TEXT = st.text(st.characters(max_codepoint=0xFFFF, blacklist_categories=["Cs"]))
+# Custom scalar strategies may generate any value nodes, including ones that are never generated by this library
+CUSTOM_SCALAR_VALUES = st.recursive(
+    st.just(nodes.Boolean(True))
+    | st.builds(graphql.StringValueNode, value=TEXT, block=st.just(True))
+    | st.builds(graphql.VariableNode, name=st.just(nodes.Name("variable"))),
+    lambda children: st.lists(children).map(nodes.List)
+    | st.lists(st.builds(graphql.ObjectFieldNode, name=st.just(nodes.Name("key")), value=children)).map(nodes.Object),
+    max_leaves=5,
+)
+
+
+@pytest.fixture(scope="module")
+def operation_schema(schema):
+    return cached_build_schema(
+        schema
+        + """
+scalar Date
+
+input LongInput {
+  firstVeryLongFieldName: String
+  secondVeryLongFieldName: [Int!]
+  nested: NestedQueryInput
+  color: EnumInput
+  date: Date
+}
+
+type Query {
+  getModel(int: Int, float: Float!, string: String, id: ID, boolean: Boolean, color: [Color]): Model
+  getByInput(longArgumentName: LongInput, another: LongInput!, required: RequiredInput): [Model]
+  getNode: Node
+  getMedia: Media
+  getBooks(text: String = "default"): [Book]
+}
+
+type Mutation {
+  addBook(title: String!, author: String!): Book!
+  addAuthor(name: String!): Author!
+}"""
+    )
+
+
+@pytest.mark.parametrize("node_factory", (make_query, make_mutation))
+@given(data=st.data())
+def test_same_as_print_ast(data, operation_schema, node_factory):
+    # When the AST is generated by this library
+    type_ = operation_schema.query_type if node_factory is make_query else operation_schema.mutation_type
+    strategy = GraphQLStrategy(
+        operation_schema,
+        alphabet=st.characters(max_codepoint=0xFFFF, blacklist_categories=["Cs"]),
+        custom_scalars={"Date": CUSTOM_SCALAR_VALUES},
+    )
+    selections = data.draw(strategy.selections(type_))
+    # Then the specialized printer should produce the same output as the one from `graphql-core`
+    assert printer.resolve(node_factory, graphql.print_ast)(selections) == graphql.print_ast(node_factory(selections))
+
+
+@pytest.mark.parametrize(
+    "node",
+    (
+        graphql.StringValueNode(value='multi\nline "text"', block=True),
+        graphql.VariableNode(name=nodes.Name("variable")),
+        nodes.List([graphql.VariableNode(name=nodes.Name("variable"))]),
+    ),
+)
+def test_print_value(node):
+    assert printer.print_value(node) == graphql.print_ast(node)
+
+
+@pytest.mark.parametrize("node_factory", (make_query, make_mutation))
+def test_empty_selections(node_factory):
+    assert printer.resolve(node_factory, graphql.print_ast)([]) == graphql.print_ast(node_factory([]))
+
+
+def test_resolve():
+    assert printer.resolve(make_query, graphql.print_ast) is printer.print_query
+    assert printer.resolve(make_mutation, graphql.print_ast) is printer.print_mutation
+    # Custom printers receive documents
+    assert printer.resolve(make_query, type)([]) is graphql.DocumentNode